@@ -52,7 +52,8 @@ After installation with ``pip install git+https://github.com/cthoyt/selventa-kno
 import logging
 import unittest
 from collections import defaultdict
-from typing import Any, Mapping, Tuple, Union
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Tuple, Union
 
 import pyobo
 from protmapper.uniprot_client import get_id_from_mnemonic, get_mnemonic
@@ -97,6 +98,14 @@ def _get_id_remapping(prefix: str, identifier: str) -> Union[Tuple[str, str, str
     return _ID_REMAPPING.get((prefix, identifier), (None, None, None))
 
 
+@lru_cache(maxsize=None)
+def _ground(prefix: Union[str, Tuple[str, ...]], name: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Ground the name with PyOBO, caching since the same annotation names recur across many edges."""
+    if isinstance(prefix, tuple):
+        prefix = list(prefix)
+    return pyobo.ground(prefix, name)
+
+
 def ground(graph: BELGraph, remove_ungrounded: bool = True) -> BELGraph:
     """Ground all entities in a BEL graph."""
     j = to_nodelink(graph)
@@ -185,12 +194,12 @@ def _process_annotations(data, remove_ungrounded: bool = False) -> None:
 
     for category, names in data[ANNOTATIONS].items():
         if category == 'CellLine':
-            _namespaces = [
+            _namespaces = (
                 'efo',
                 # 'clo',  # FIXME implement CLO import and add here
-            ]
+            )
             for name, polarity in names.items():
-                g_prefix, g_identifier, g_name = pyobo.ground(_namespaces, name)
+                g_prefix, g_identifier, g_name = _ground(_namespaces, name)
                 if g_prefix and g_identifier:
                     grounded_category_curie_polarity.append((
                         category, Entity(namespace=g_prefix, identifier=g_identifier, name=g_name), polarity,
@@ -202,7 +211,7 @@ def _process_annotations(data, remove_ungrounded: bool = False) -> None:
             norm_prefix = _BEL_ANNOTATION_PREFIX_MAP[category]
             norm_category = _BEL_ANNOTATION_PREFIX_CATEGORY_MAP.get(category, category)
             for name, polarity in names.items():
-                _, identifier, _ = pyobo.ground(norm_prefix, name)
+                _, identifier, _ = _ground(norm_prefix, name)
                 if identifier:
                     grounded_category_curie_polarity.append((
                         norm_category, Entity(namespace=norm_prefix, identifier=identifier, name=name), polarity,
@@ -213,7 +222,7 @@ def _process_annotations(data, remove_ungrounded: bool = False) -> None:
         elif normalize_prefix(category):
             norm_prefix = normalize_prefix(category)
             for name, polarity in names.items():
-                _, identifier, _ = pyobo.ground(norm_prefix, name)
+                _, identifier, _ = _ground(norm_prefix, name)
                 if identifier:
                     grounded_category_curie_polarity.append((
                         category, Entity(namespace=norm_prefix, identifier=identifier, name=name), polarity,
@@ -25,6 +25,7 @@ __all__ = [
 URL_FORMAT = 'https://emmaa.s3.amazonaws.com/assembled/{}/statements_{}.json'
 LISTING = 'https://emmaa.s3.amazonaws.com/'
 NS = '{http://s3.amazonaws.com/doc/2006-03-01/}'
+KEY_PATH = '{aws}Contents/{aws}Key'.format(aws=NS)
 
 
 def from_emmaa(model: str, *, date: Optional[str] = None) -> BELGraph:
@@ -77,7 +78,7 @@ def _get_latest_date(model: str) -> str:
 
 
 def _iter_dates(tree, model: str) -> Iterable[str]:
-    for x in tree.findall('{aws}Contents/{aws}Key'.format(aws=NS)):
-        prefix = 'assembled/{}/statements_'.format(model)
+    prefix = 'assembled/{}/statements_'.format(model)
+    for x in tree.iterfind(KEY_PATH):
         if x.text.startswith(prefix):
             yield x.text[len(prefix):-len('.json')]
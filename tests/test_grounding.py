@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for grounding."""
+
+import unittest
+from unittest import mock
+
+try:
+    from pybel.grounding import _ground
+except ImportError:
+    _ground = None
+
+
+@unittest.skipIf(_ground is None, 'Need pyobo and protmapper to test grounding')
+class TestGroundCache(unittest.TestCase):
+    """Test the cache around PyOBO grounding."""
+
+    def setUp(self):
+        _ground.cache_clear()
+
+    def tearDown(self):
+        _ground.cache_clear()
+
+    def test_repeated_names(self):
+        """Test that a repeated (prefix, name) pair only hits PyOBO once."""
+        with mock.patch('pyobo.ground', return_value=('mesh', 'D000001', 'Calcimycin')) as mock_ground:
+            for _ in range(3):
+                self.assertEqual(('mesh', 'D000001', 'Calcimycin'), _ground('mesh', 'Calcimycin'))
+            self.assertEqual(1, mock_ground.call_count)
+            mock_ground.assert_called_once_with('mesh', 'Calcimycin')
+
+            _ground('mesh', 'Aspirin')
+            self.assertEqual(2, mock_ground.call_count)
+
+    def test_tuple_prefixes(self):
+        """Test that a tuple of prefixes is passed to PyOBO as a list."""
+        with mock.patch('pyobo.ground', return_value=(None, None, None)) as mock_ground:
+            self.assertEqual((None, None, None), _ground(('efo', 'clo'), 'HeLa'))
+            _ground(('efo', 'clo'), 'HeLa')
+            mock_ground.assert_called_once_with(['efo', 'clo'], 'HeLa')